@@ -2,17 +2,27 @@ import sys
 import os
 from PyQt5.QtWidgets import (
     QMainWindow, QVBoxLayout, QPushButton, QLabel,
-    QFileDialog, QLineEdit, QHBoxLayout, QSpinBox, QWidget, QListWidget, QCheckBox,
-    QDoubleSpinBox, QComboBox, QListWidgetItem, QAbstractItemView
+    QFileDialog, QLineEdit, QHBoxLayout, QSpinBox, QWidget, QListView, QCheckBox,
+    QDoubleSpinBox, QComboBox, QAbstractItemView, QProgressBar
 )
-from PyQt5.QtCore import (Qt)
+from PyQt5.QtCore import (Qt, QAbstractListModel, QBuffer, QByteArray, QModelIndex,
+                          QObject, QRunnable, QSignalBlocker, QStringListModel,
+                          QThreadPool, QTimer, pyqtSignal)
+from dataclasses import (dataclass, field)
 from PyQt5.QtGui import (QMovie)
 from pathlib import Path
-from matplotlib import font_manager
+import functools
+import hashlib
+import operator
+import pickle
 import platform
+import re
 import unicodedata
-from sub2clip.sub2clip import (extract_subs, generate)
-from sub2clip.generation import (TextStyle, ClipSettings, VideoFormat)
+from bisect import bisect_right
+from itertools import accumulate
+# The sub2clip generation imports are deferred to first use: they pull in
+# pysubs2, python-ffmpeg and PIL, which is noticeable on cold startup
+from returns.result import (Success, Failure)
 from sub2clip.subtitles import Subtitle
 from .rangeslider import RangeSlider
 
@@ -20,25 +30,244 @@ from loguru import logger
 logger.remove()
 logger.add(sys.stdout, format="<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level: <8}</level> | <level>{message}</level>")
 
-class SubtitleListItem(QListWidgetItem):
+# Evaluated once; platform.system() is not free on first call
+_IS_WINDOWS = platform.system() == 'Windows'
+
+_FONT_CACHE = Path.home() / '.cache' / 'sub2clip' / 'fonts.pkl'
+
+# Directories whose mtimes invalidate the font cache when fonts get (un)installed
+_FONT_DIRS = [
+    Path('/usr/share/fonts'),
+    Path('/usr/local/share/fonts'),
+    Path.home() / '.fonts',
+    Path.home() / '.local/share/fonts',
+    Path('/Library/Fonts'),
+    Path('/System/Library/Fonts'),
+    Path.home() / 'Library/Fonts',
+    Path('C:/Windows/Fonts'),
+]
+
+def _font_cache_key():
+    from importlib.metadata import version
+    dirs = tuple((str(d), d.stat().st_mtime) for d in _FONT_DIRS if d.is_dir())
+    return (version('matplotlib'), dirs)
+
+def _load_font_list():
     """
-    Custom class to show the subtitle in the List widget with the source video stored
+    List of (display string, font file path) for every installed font.
+
+    Enumerating matplotlib's font manager takes seconds on font-heavy
+    systems, so the result is pickled to ~/.cache/sub2clip and reused
+    until the matplotlib version or a font directory changes.
+    """
+    key = _font_cache_key()
+    try:
+        with open(_FONT_CACHE, 'rb') as f:
+            cached_key, fonts = pickle.load(f)
+        if cached_key == key:
+            return fonts
+    except (OSError, pickle.PickleError, EOFError, ValueError):
+        pass
+
+    from matplotlib import font_manager
+    # attrgetter keeps the key extraction in C; only runs on cache miss
+    ttf = sorted(font_manager.fontManager.ttflist, key=operator.attrgetter('name', 'weight'))
+
+    fonts = []
+    for font in ttf:
+        font_str = f'{font.name} {font.weight}'
+        if font.style != 'normal':
+            font_str += f' {font.style}'
+        fonts.append((font_str, font.fname))
+
+    try:
+        _FONT_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        with open(_FONT_CACHE, 'wb') as f:
+            pickle.dump((key, fonts), f)
+    except OSError:
+        pass
+    return fonts
+
+_SUBS_CACHE_DIR = Path.home() / '.cache' / 'sub2clip' / 'subs'
+
+def _cached_extract_subs(path):
+    """extract_subs with a per-video pickle cache.
+
+    Keyed on resolved path, mtime and size, so reselecting 'All videos'
+    skips the ffmpeg/ffprobe round trip for unchanged files.
+    """
+    from sub2clip.sub2clip import extract_subs
+
+    path = Path(path)
+    try:
+        st = os.stat(path)
+        key = hashlib.blake2b(
+            f'{path.resolve()}|{st.st_mtime_ns}|{st.st_size}'.encode(),
+            digest_size=16
+        ).hexdigest()
+        cache_file = _SUBS_CACHE_DIR / f'{key}.pkl'
+        if cache_file.exists():
+            # Link-free tuples on disk; rebuild the cues and their pairwise
+            # prv/nxt links here. Pickling the linked Subtitle objects
+            # themselves recurses through the whole chain and hits the
+            # recursion limit at a few hundred cues.
+            rows = pickle.loads(cache_file.read_bytes())
+            subs = [Subtitle(start=start, end=end, text=text, delay=delay)
+                    for start, end, text, delay in rows]
+            for prv, nxt in zip(subs, subs[1:]):
+                prv.nxt = nxt
+                nxt.prv = prv
+            return Success(subs)
+    except OSError:
+        return extract_subs(path)
+    except (pickle.PickleError, AttributeError, EOFError, TypeError, ValueError, RecursionError):
+        # Stale or corrupt entry (e.g. written against an older cache
+        # layout); re-extract and let the write below replace it
+        pass
+
+    res = extract_subs(path)
+    match res:
+        case Success(subs):
+            try:
+                _SUBS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                cache_file.write_bytes(pickle.dumps(
+                    [(sub.start, sub.end, sub.text, sub.delay) for sub in subs]))
+            except (OSError, RecursionError):
+                pass
+    return res
+
+def _build_diacrit_table():
+    # Latin-1 Supplement + Latin Extended-A letters mapped to their base form
+    table = {}
+    for cp in range(0x80, 0x180):
+        decomposed = unicodedata.normalize('NFD', chr(cp))
+        base = ''.join(c for c in decomposed if unicodedata.category(c) != 'Mn')
+        if base != chr(cp):
+            table[cp] = base
+    return table
+
+_DIACRIT_TABLE = _build_diacrit_table()
+
+@functools.lru_cache(maxsize=1)
+def _mn_delete_table():
+    # Maps every BMP combining mark to None; built on first non-Latin string
+    # since scanning 65k codepoints is not free at import time
+    return {cp: None for cp in range(0x10000) if unicodedata.category(chr(cp)) == 'Mn'}
+
+_VIDEO_EXTS = frozenset({'.mp4', '.mkv'})
+
+def _iter_videos(root):
+    """Yield video file paths under root. scandir-based: DirEntry caches the
+    file type from the directory read, so no extra stat per entry."""
+    stack = [root]
+    while stack:
+        # Unreadable or vanished subdirectories are skipped, like the
+        # os.walk default this walker replaced
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name[-4:].lower() in _VIDEO_EXTS:
+                        yield entry.path
+        except OSError:
+            continue
+
+class _WorkerSignals(QObject):
+    finished = pyqtSignal(object)
+    progress = pyqtSignal(int)
+
+class Worker(QRunnable):
     """
-    def __init__(self, sub_text, source_video, start_ms, end_ms, sub_id):
-        self.sub_text = sub_text
-        self.source_video = source_video
-        self.start_ms = start_ms
-        self.end_ms   = end_ms
-        self.start_s = start_ms / 1000
-        self.end_s   = end_ms / 1000
-        self.sub_id = sub_id
-
-        super().__init__(str(self))
-        self.video_basename = os.path.basename(source_video)
-        self.setStatusTip(self.video_basename)
-
-    def __str__(self) -> str:
-        return f"[{self.start_s}s - {self.end_s}s] {self.sub_text}"
+    Runs a callable on the global QThreadPool and reports the return value
+    back to the GUI thread via the finished signal. Keeps ffmpeg/ffprobe
+    subprocess waits off the Qt event loop so the window stays responsive.
+
+    With report_progress the callable receives a `progress` kwarg it can
+    call with 0-100 percentages; values arrive on the GUI thread via the
+    progress signal.
+    """
+    def __init__(self, fn, *args, report_progress=False):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.report_progress = report_progress
+        self.signals = _WorkerSignals()
+
+    def run(self):
+        kwargs = {'progress': self.signals.progress.emit} if self.report_progress else {}
+        try:
+            result = self.fn(*self.args, **kwargs)
+        except Exception as e:
+            result = Failure(str(e))
+        self.signals.finished.emit(result)
+
+@dataclass
+class _VideoIndex:
+    """Per-video search data, built once when subtitles load.
+
+    buf joins the normalized subtitle lines with newlines so a query is a
+    single C-level scan; offsets maps a match position back to its row.
+    """
+    video: str
+    basename: str
+    buf: str
+    offsets: list[int]
+    displays: list[str] = field(default_factory=list)
+    starts: list[int] = field(default_factory=list)
+    ends: list[int] = field(default_factory=list)
+    texts: list[str] = field(default_factory=list)
+
+class SubtitleModel(QAbstractListModel):
+    """List model over parallel arrays of subtitle rows.
+
+    QListWidget allocates a full QListWidgetItem per row, which for a large
+    library is megabytes of Qt objects just to render text; the view only
+    asks this model for the rows it actually paints.
+
+    One header row per video separates the groups; headers carry a sub_id
+    of -1 and are not selectable.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.displays = []
+        self.videos = []
+        self.basenames = []
+        self.starts = []
+        self.ends = []
+        self.sub_ids = []
+        self.texts = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.displays)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self.displays[index.row()]
+        if role == Qt.StatusTipRole:
+            return self.basenames[index.row()]
+        return None
+
+    def flags(self, index):
+        if not index.isValid() or self.is_header(index.row()):
+            return Qt.ItemIsEnabled
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def is_header(self, row):
+        return self.sub_ids[row] < 0
+
+    def set_rows(self, displays, videos, basenames, starts, ends, sub_ids, texts):
+        self.beginResetModel()
+        self.displays = displays
+        self.videos = videos
+        self.basenames = basenames
+        self.starts = starts
+        self.ends = ends
+        self.sub_ids = sub_ids
+        self.texts = texts
+        self.endResetModel()
 
 class Sub2Clip(QMainWindow):
     def __init__(self, video=None, directory=None):
@@ -73,12 +302,25 @@ class Sub2Clip(QMainWindow):
         # Subtitle Search
         self.subtitle_search_input = QLineEdit()
         self.subtitle_search_input.setPlaceholderText("Search subtitles...")
-        self.subtitle_search_input.textChanged.connect(self.search_subtitles)
+        # Debounce live search so fast typing triggers one scan, not one per key
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.timeout.connect(self.search_subtitles)
+        self._last_query = None
+        self._extract_worker = None
+        self._has_original = False
+        self._last_norm = ''
+        self._last_rows = None
+        self.subtitle_search_input.textChanged.connect(lambda _: self._search_timer.start(200))
         self.subtitle_search_button = QPushButton("Search")
         self.subtitle_search_button.clicked.connect(self.search_subtitles)
-        self.subtitle_results = QListWidget()
+        self.subtitle_model = SubtitleModel(self)
+        self.subtitle_results = QListView()
+        self.subtitle_results.setModel(self.subtitle_model)
         self.subtitle_results.setSelectionMode(QAbstractItemView.SelectionMode.ContiguousSelection)
-        self.subtitle_results.itemClicked.connect(self.select_search_result)
+        # All rows are one line high; skips per-item size hints on bulk inserts
+        self.subtitle_results.setUniformItemSizes(True)
+        self.subtitle_results.clicked.connect(self.select_search_result)
         subtitle_layout = QHBoxLayout()
         subtitle_layout.addWidget(self.subtitle_search_input)
         subtitle_layout.addWidget(self.subtitle_search_button)
@@ -157,6 +399,12 @@ class Sub2Clip(QMainWindow):
         # Create boomerang?
         self.boomerang_checkbox = QCheckBox("Boomerang")
 
+        # Smaller/faster GIFs (mpdecimate + ordered dither)
+        self.optimize_checkbox = QCheckBox("Optimize size")
+
+        # Draft-quality GIFs without the palette pass
+        self.fast_preview_checkbox = QCheckBox("Fast preview")
+
         # Also create mp4 with HC subs? (mp4s have better compression)
         self.mp4_copy_checkbox = QCheckBox("MP4 with subs")
 
@@ -177,13 +425,15 @@ class Sub2Clip(QMainWindow):
         video_settings_layout.addWidget(self.square_checkbox)
         video_settings_layout.addWidget(self.boomerang_checkbox)
         video_settings_layout.addWidget(self.fancy_colors_checkbox)
+        video_settings_layout.addWidget(self.optimize_checkbox)
+        video_settings_layout.addWidget(self.fast_preview_checkbox)
         video_settings_layout.addWidget(self.mp4_copy_checkbox)
         video_settings_layout.addWidget(self.font_size)
         video_settings_layout.addWidget(self.resolution)
         self.main_layout.addLayout(video_settings_layout)
 
         # Choose font
-        if platform.system() == 'Windows':
+        if _IS_WINDOWS:
             self.font_label = QLabel("Font: Arial (default)")
         else:
             self.font_label = QLabel('Font: (default)')
@@ -191,21 +441,15 @@ class Sub2Clip(QMainWindow):
         self.main_layout.addWidget(self.font_label)
         self.font_dropdown = QComboBox()
 
-        ttf = font_manager.fontManager.ttflist
-        ttf.sort(key=lambda font: (font.name, font.weight))
-        self.font_dict = {}
-
-        for font in ttf:
-            font_str = f'{font.name} {font.weight}'
-            if font.style != 'normal':
-                font_str += f' {font.style}'
-
-            self.font_dropdown.addItem(font_str)
-            self.font_dict[font_str] = Path(font.fname)
-
+        self._font_paths = []
         self.font_dropdown.currentIndexChanged.connect(self.on_font_select)
         self.main_layout.addWidget(self.font_dropdown)
 
+        # Populate after the event loop starts so the window paints first;
+        # SUB2CLIP_NO_FONT_SCAN skips enumeration entirely
+        if not os.environ.get('SUB2CLIP_NO_FONT_SCAN'):
+            QTimer.singleShot(0, self._populate_fonts)
+
         # Generate Button
         self.generate_vid_button = QPushButton("Generate")
         self.generate_vid_button.clicked.connect(self.generate)
@@ -224,6 +468,12 @@ class Sub2Clip(QMainWindow):
         self.status_label = QLabel("")
         self.main_layout.addWidget(self.status_label)
 
+        # Encode progress, fed from ffmpeg's -progress stream
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setVisible(False)
+        self.main_layout.addWidget(self.progress_bar)
+
         # Preview
         self.vid_preview = QLabel("Preview will appear here")
         self.vid_preview.setAlignment(Qt.AlignCenter)
@@ -238,10 +488,14 @@ class Sub2Clip(QMainWindow):
         self.video_file = None
         self.subtitle_file = None
         self.subtitles = []
-        self.subtitle_list_items = []
+        self._search_index = []
         self.PADDING = 10 # Time in seconds to pad the original timing on each side for the slider
 
-        if platform.system() == 'Windows':
+        # Created once; generate paths assume it exists
+        self._out_dir = Path('output')
+        self._out_dir.mkdir(exist_ok=True)
+
+        if _IS_WINDOWS:
             self.selected_font_path = Path("C:/Windows/Fonts/arial.ttf")
         else: self.selected_font_path = ''
 
@@ -254,22 +508,23 @@ class Sub2Clip(QMainWindow):
 
 
     def load_directory(self, directory=None):
-        self.directory = directory if directory else QFileDialog.getExistingDirectory(self, caption="Select Directory", directory="")
+        self._has_original = False
+        # Per-file icon lookups make the dialog crawl on big directories
+        self.directory = directory if directory else QFileDialog.getExistingDirectory(
+            self, caption="Select Directory", directory="",
+            options=QFileDialog.ShowDirsOnly | QFileDialog.DontUseCustomDirectoryIcons)
         if self.directory:
             self.video_label.setText(f'Selected Directory: {os.path.basename(self.directory)}')
-            self.videos = []
 
-            self.video_dropdown.clear()
-            self.video_dropdown.addItem('All videos')
+            self.videos = sorted(_iter_videos(self.directory))
 
-            for dirpath, _, filenames in os.walk(self.directory):
-                for file in filenames:
-                    if file.lower().endswith(('.mp4', '.mkv')):
-                        path = os.path.join(dirpath, file)
-                        self.videos.append(path)
+            # One model reset instead of per-item inserts, and no
+            # currentIndexChanged storm while repopulating
+            self.video_dropdown.blockSignals(True)
+            self.video_dropdown.setModel(QStringListModel(['All videos'] + self.videos))
+            self.video_dropdown.setCurrentIndex(0)
+            self.video_dropdown.blockSignals(False)
 
-            self.videos.sort()
-            self.video_dropdown.addItems(self.videos)
             self.video_dropdown.setEnabled(True)
             self.on_video_select()
 
@@ -279,29 +534,60 @@ class Sub2Clip(QMainWindow):
             idx = self.video_dropdown.currentIndex()
             if idx == 0 or idx == -1:
                 logger.info('Loading all subtitles..')
+                self.status_label.setText("Loading subtitles...")
 
-                self.subtitles = []
-
-                for video in self.videos:
-                    subs, success = extract_subs(video)
-                    if success:
-                        logger.debug(f'Subs loaded for {video}')
-                        self.subtitles.append((subs, video))
-                    else:
-                        logger.error(subs)
-
-                self.load_all_subs()
+                worker = Worker(self._extract_all_job, list(self.videos))
+                self._extract_worker = worker
+                worker.signals.finished.connect(
+                    lambda res, w=worker: self._on_all_subs_extracted(res, w))
+                QThreadPool.globalInstance().start(worker)
             else:
                 video_str = self.video_dropdown.currentText()
                 self.load_video(video=video_str)
 
+    @staticmethod
+    def _extract_all_job(videos):
+        from concurrent.futures import ThreadPoolExecutor
+
+        # extract_subs waits on ffmpeg/ffprobe subprocesses, so threads
+        # overlap the extraction latency across videos
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as ex:
+            results = list(ex.map(_cached_extract_subs, videos))
+        return Success(list(zip(results, videos)))
+
+    def _on_all_subs_extracted(self, res, worker):
+        # A newer selection has its own worker; drop this stale result so it
+        # can't clobber the subtitles the user is actually looking at
+        if worker is not self._extract_worker:
+            return
+        match res:
+            case Success(pairs):
+                self.subtitles = []
+                for result, video in pairs:
+                    match result:
+                        case Success(subs):
+                            # lazy: the message is only built when DEBUG is on
+                            logger.opt(lazy=True).debug('Subs loaded for {}', lambda v=video: v)
+                            self.subtitles.append((subs, video))
+                        case Failure(err):
+                            logger.error(err)
+
+                self.status_label.setText("")
+                self._last_query = None
+                self.load_all_subs()
+            case Failure(err):
+                logger.error(err)
+                self.status_label.setText("Could not load subtitles")
+
 
     def load_video(self, video=None):
         """Load a video file and update the time slider range"""
 
         # If video is None or False, open file dialog
         if video is None or video is False:
-            video_path, _ = QFileDialog.getOpenFileName(self, "Select Video File", "", "Video Files (*.mp4 *.mkv)")
+            video_path, _ = QFileDialog.getOpenFileName(
+                self, "Select Video File", "", "Video Files (*.mp4 *.mkv)",
+                options=QFileDialog.DontUseCustomDirectoryIcons)
             if not video_path:  # User cancelled the dialog
                 return
             video = str(video_path)  # Ensure it's a string
@@ -321,6 +607,7 @@ class Sub2Clip(QMainWindow):
             self.status_label.setText("Video file not found")
             return
 
+        self._has_original = False
         self.video_file = video
         self.video_label.setText(f"Selected Video: {os.path.basename(video)}")
 
@@ -328,29 +615,64 @@ class Sub2Clip(QMainWindow):
         if video is None:
             self.video_dropdown.setEnabled(False)
 
-        # Extract subtitles
-        subs, success = extract_subs(self.video_file)
-        if success:
-            logger.success(f'Loaded subtitles for {self.video_file}')
-            self.subtitles = [(subs, self.video_file)]
-            self.status_label.setText("Subtitles loaded successfully!")
-
-            # Set up time slider with 10 second range and padding
-            self.time_slider.setRange(0, 1000)  # 1000 steps for precision
-            self.time_slider.setValues(0, 1000)  # Set full range initially
-
-            # Set initial times with padding
-            self.start_time.setValue(0)  # 1 second padding at start
-            self.end_time.setValue(0)    # 1 second padding at end
-            self.start_time_label.setText("")
-            self.end_time_label.setText("")
-
-            self.time_slider.setEnabled(False)
+        # Extract subtitles on a worker so the ffmpeg calls don't block the UI
+        self.status_label.setText("Extracting subtitles...")
+        worker = Worker(_cached_extract_subs, Path(self.video_file))
+        self._extract_worker = worker
+        worker.signals.finished.connect(
+            lambda res, w=worker: self._on_subs_extracted(res, w))
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_subs_extracted(self, res, worker):
+        # See _on_all_subs_extracted: only the latest request may apply
+        if worker is not self._extract_worker:
+            return
+        match res:
+            case Success(subs):
+                pass
+            case Failure(err):
+                logger.error(f"Failed to extract subtitles: {err}")
+                self.status_label.setText("No subtitles found.")
+                return
 
-            self.load_all_subs()
-        else:
-            logger.error(f"Failed to extract subtitles: {subs}")
-            self.status_label.setText("No subtitles found.")
+        logger.success(f'Loaded subtitles for {self.video_file}')
+        self.subtitles = [(subs, self.video_file)]
+        self.status_label.setText("Subtitles loaded successfully!")
+
+        # Set up time slider with 10 second range and padding
+        self.time_slider.setRange(0, 1000)  # 1000 steps for precision
+        self.time_slider.setValues(0, 1000)  # Set full range initially
+
+        # Set initial times with padding
+        self.start_time.setValue(0)  # 1 second padding at start
+        self.end_time.setValue(0)    # 1 second padding at end
+        self.start_time_label.setText("")
+        self.end_time_label.setText("")
+
+        self.time_slider.setEnabled(False)
+
+        self._last_query = None
+        self.load_all_subs()
+
+    def _populate_fonts(self):
+        # A cold matplotlib font scan takes seconds; run it on the pool
+        self._font_worker = Worker(lambda: Success(_load_font_list()))
+        self._font_worker.signals.finished.connect(self._on_fonts_loaded)
+        QThreadPool.globalInstance().start(self._font_worker)
+
+    def _on_fonts_loaded(self, res):
+        match res:
+            case Success(fonts):
+                # Keep the raw filename strings; Path construction is
+                # deferred to on_font_select for the one font actually chosen
+                self._font_paths = [fname for _, fname in fonts]
+
+                # One model swap instead of an insertion signal per font
+                self.font_dropdown.blockSignals(True)
+                self.font_dropdown.setModel(QStringListModel([font_str for font_str, _ in fonts]))
+                self.font_dropdown.blockSignals(False)
+            case Failure(err):
+                logger.error(f'Font enumeration failed: {err}')
 
     def format_changed(self):
         if self.select_format.currentText() == 'gif':
@@ -359,25 +681,49 @@ class Sub2Clip(QMainWindow):
 
     def on_font_select(self):
         font_str = self.font_dropdown.currentText()
-        font_path = self.font_dict[font_str]
+        font_path = Path(self._font_paths[self.font_dropdown.currentIndex()])
 
         self.font_label.setText(f'Font: {font_str}')
         self.selected_font_path = font_path
 
-    def normalize_string(self, s):
-        return ''.join(
-            c for c in unicodedata.normalize('NFD', s.replace('\\N', ' '))
-            if unicodedata.category(c) != 'Mn'
-        )
-
-    def add_header(self, video):
-        header = QListWidgetItem(video)
-        flags = header.flags()
-        flags &= Qt.ItemFlag.ItemIsSelectable
-        header.setFlags(flags)
-        self.subtitle_results.addItem(header)
-        return header
-
+    def normalize_string(self, s, _nfd=unicodedata.normalize):
+        s = s.replace('\\N', ' ')
+
+        # ASCII has no combining marks; skip the NFD round trip entirely
+        if s.isascii():
+            return s
+
+        # C-level table lookup handles the common Latin accents
+        s = s.translate(_DIACRIT_TABLE)
+        if s.isascii():
+            return s
+
+        # Rare: scripts beyond Latin Extended-A decompose and drop the
+        # combining marks with a C-level translate instead of a Python loop
+        return _nfd('NFD', s).translate(_mn_delete_table())
+
+    @staticmethod
+    def _append_video_rows(cols, index, rows=None):
+        """Append one header row plus the given rows of a _VideoIndex to the
+        column lists destined for SubtitleModel.set_rows."""
+        displays, videos, basenames, starts, ends, sub_ids, texts = cols
+
+        displays.append(index.video)
+        videos.append(index.video)
+        basenames.append(index.basename)
+        starts.append(0)
+        ends.append(0)
+        sub_ids.append(-1)
+        texts.append('')
+
+        for i in (range(len(index.displays)) if rows is None else rows):
+            displays.append(index.displays[i])
+            videos.append(index.video)
+            basenames.append(index.basename)
+            starts.append(index.starts[i])
+            ends.append(index.ends[i])
+            sub_ids.append(i)
+            texts.append(index.texts[i])
 
     def search_subtitles(self):
         query = self.subtitle_search_input.text().strip()
@@ -385,66 +731,92 @@ class Sub2Clip(QMainWindow):
             self.status_label.setText("Please load subtitles")
             return
 
+        # Enter + Search click (or the debounce timer) double-fire on the
+        # same text; only rescan when the query actually changed
+        if query == self._last_query:
+            return
+        self._last_query = query
+
         if not query:
             self.load_all_subs()
             return
 
-        self.subtitle_results.clear()
         query_norm = self.normalize_string(query).lower()
 
-        for (subfile, video) in self.subtitles:
-            h = self.add_header(video)
-            found = any(query_norm in self.normalize_string(sub.text).lower() for sub in subfile)
-
-            if not found:
-                self.subtitle_results.takeItem(self.subtitle_results.row(h))
-                continue
-
-            for subItem in self.subtitle_list_items:
-                if subItem.source_video != video:
-                    continue
+        # Typing extends the query, and every row still matching must have
+        # matched the shorter prefix — recheck only the previous matches
+        narrow = self._last_rows is not None and self._last_norm and query_norm.startswith(self._last_norm)
+
+        cols = ([], [], [], [], [], [], [])
+        new_rows = []
+        if narrow:
+            for index, prev in zip(self._search_index, self._last_rows):
+                offsets = index.offsets
+                rows = [r for r in prev if query_norm in index.buf[offsets[r]:offsets[r + 1] - 1]]
+                new_rows.append(rows)
+                if rows:
+                    self._append_video_rows(cols, index, rows)
+        else:
+            pat = re.compile(re.escape(query_norm))
+            for index in self._search_index:
+                # One C-level scan over the joined buffer instead of a Python
+                # substring test per subtitle; offsets map a match back to its row
+                rows = sorted({bisect_right(index.offsets, m.start()) - 1 for m in pat.finditer(index.buf)})
+                new_rows.append(rows)
+                if rows:
+                    self._append_video_rows(cols, index, rows)
 
-                sub_norm = self.normalize_string(subItem.sub_text).lower()
-                if query_norm in sub_norm:
-                    widget = SubtitleListItem(
-                        sub_text=subItem.sub_text,
-                        source_video=subItem.source_video,
-                        start_ms=subItem.start_ms,
-                        end_ms=subItem.end_ms,
-                        sub_id=subItem.sub_id
-                    )
-                    self.subtitle_results.addItem(widget)
+        self._last_norm = query_norm
+        self._last_rows = new_rows
 
+        # Single model reset; the view repaints once
+        self.subtitle_model.set_rows(*cols)
 
     def load_all_subs(self):
-        self.subtitle_results.clear()
-        self.subtitle_list_items = []
+        self._search_index = []
+        self._last_norm = ''
+        self._last_rows = None
+        cols = ([], [], [], [], [], [], [])
         for (subfile, video) in self.subtitles:
-            self.add_header(video)
-            for idx, sub in enumerate(subfile):
-                widget = SubtitleListItem(
-                    sub_text=sub.text,
-                    source_video=video,
-                    start_ms=sub.start,
-                    end_ms=sub.end,
-                    sub_id=idx
-                )
-                self.subtitle_list_items.append(widget)
-                self.subtitle_results.addItem(widget)
+            # Normalize once at load time; search_subtitles reuses this
+            # instead of re-running NFD decomposition per query
+            norms = [self.normalize_string(sub.text).lower() for sub in subfile]
+            index = _VideoIndex(
+                video=video,
+                basename=os.path.basename(video),
+                buf="\n".join(norms),
+                offsets=[0] + list(accumulate(len(n) + 1 for n in norms)),
+                displays=[f"[{sub.start / 1000}s - {sub.end / 1000}s] {sub.text}" for sub in subfile],
+                starts=[sub.start for sub in subfile],
+                ends=[sub.end for sub in subfile],
+                texts=[sub.text for sub in subfile],
+            )
+            self._search_index.append(index)
+            self._append_video_rows(cols, index)
 
+        self.subtitle_model.set_rows(*cols)
 
-    def select_search_result(self, item):
-        if isinstance(item, SubtitleListItem):
+    def select_search_result(self, index):
+        row = index.row()
+        model = self.subtitle_model
+        if not model.is_header(row):
             self.time_slider.setEnabled(True)
 
-            selected_items = self.subtitle_results.selectedItems()
-            selected_items.sort(key=lambda i: i.start_ms)
+            selected = sorted(i.row() for i in self.subtitle_results.selectedIndexes())
+            if not selected:
+                selected = [row]
 
-            self.video_file = item.source_video
+            self.video_file = model.videos[row]
 
             # Store original subtitle times
-            self.original_start = float(selected_items[0].start_s)
-            self.original_end = float(selected_items[-1].end_s)
+            self.original_start = model.starts[selected[0]] / 1000
+            self.original_end = model.ends[selected[-1]] / 1000
+            self._has_original = True
+
+            # Slider<->time mapping is affine in the originals; cache the
+            # coefficients here instead of recomputing them per drag event
+            self._slider_step = 1000 / (self.original_end - self.original_start + 2 * self.PADDING)
+            self._slider_zero = self.original_start - self.PADDING
 
             # Set initial times to original subtitle times
             self.start_time.setValue(self.original_start)
@@ -467,48 +839,45 @@ class Sub2Clip(QMainWindow):
             self.start_time_label.setText(f"Start: {self.original_start:.2f}s")
             self.end_time_label.setText(f"End: {self.original_end:.2f}s")
 
-            self.custom_text_input.setText(item.sub_text)
+            self.custom_text_input.setText(model.texts[row])
 
             # Enable reset button
             self.reset_button.setEnabled(True)
 
     def reset_timing(self):
         """Reset the timing to the original subtitle times"""
-        if hasattr(self, 'original_start') and hasattr(self, 'original_end'):
+        if self._has_original:
             self.start_time.setValue(self.original_start)
             self.end_time.setValue(self.original_end)
             self.time_slider.resetToOriginal()
 
     def generate(self):
-        if not os.path.exists('output/'):
-            os.makedirs('output')
+        from sub2clip.generation import (TextStyle, VideoFormat)
 
-        items = self.subtitle_results.selectedItems()
-        items.sort(key=lambda i: i.start_ms)
+        model = self.subtitle_model
+        rows = sorted(i.row() for i in self.subtitle_results.selectedIndexes())
+        rows = [r for r in rows if not model.is_header(r)]
 
-        if len(items) > 1:
+        if len(rows) > 1:
 
-            if any(curr.sub_id != prev.sub_id + 1 for prev, curr in zip(items, items[1:])):
+            if any(model.sub_ids[curr] != model.sub_ids[prev] + 1 for prev, curr in zip(rows, rows[1:])):
                 s = 'Illegal sequence of subtitles: Selected subtitles must be sequential'
                 self.status_label.setText(s)
 
                 logger.error(s)
                 return
 
-            output_dir = Path("output/")
-            output_clip = output_dir / "clip.mp4"
-            output_vid = output_dir / f"output.{self.select_format.currentText()}"
+            output_vid = self._out_dir / f"output.{self.select_format.currentText()}"
 
-            start = items[0].start_ms
-            end   = items[-1].end_ms
+            start = model.starts[rows[0]]
+            end   = model.ends[rows[-1]]
 
             subtitle_style = TextStyle(
                 font_size=self.font_size.value()
             )
 
-            clip_settings = ClipSettings(
-                input_path=self.video_file,
-                clip_path=output_clip,
+            clip_kwargs = dict(
+                input_path=Path(self.video_file),
                 output_path=output_vid,
                 output_format=VideoFormat[self.select_format.currentText().upper()],
                 subtitle_style=subtitle_style,
@@ -519,15 +888,17 @@ class Sub2Clip(QMainWindow):
                 crop=self.square_checkbox.isChecked(),
                 boomerang=self.boomerang_checkbox.isChecked(),
                 hd_gif=self.fancy_colors_checkbox.isChecked(),
+                optimize=self.optimize_checkbox.isChecked(),
+                fast_preview=self.fast_preview_checkbox.isChecked(),
                 mp4_copy=self.mp4_copy_checkbox.isChecked()
             )
 
             subs = [
                 Subtitle(
-                    start=sub.start_ms,
-                    end=sub.end_ms,
-                    text=sub.sub_text.split("\\N")
-                ) for idx, sub in enumerate(items)
+                    start=model.starts[r],
+                    end=model.ends[r],
+                    text=model.texts[r].split("\\N")
+                ) for r in rows
             ]
 
             cap = None
@@ -539,22 +910,15 @@ class Sub2Clip(QMainWindow):
                     text=caption.split("\\N")
                 )
 
-            err, ok = generate(clip_settings, subs, cap)
-
-            if ok:
-                size_mb = os.path.getsize(output_vid) / (1024 * 1024)
-                size_mb = f"{size_mb:.2f}"
-                self.status_label.setText(f"'{output_vid}' generated, size={size_mb}MB")
-                self.preview_vid(output_vid.as_posix())
-                logger.success(f'{output_vid} generated, size={size_mb}MB')
-            else:
-                logger.error(err)
+            self._submit_generation(clip_kwargs, subs, cap, output_vid)
 
         else:
             self.generate_vid()
 
 
     def generate_vid(self):
+        from sub2clip.generation import (TextStyle, VideoFormat)
+
         if not self.video_file:
             self.status_label.setText("Please load a video first.")
             return
@@ -565,23 +929,17 @@ class Sub2Clip(QMainWindow):
             self.status_label.setText("Invalid start and end times.")
             return
 
-        output_dir = Path("output/")
-        output_clip = output_dir / "clip.mp4"
-        output_vid = output_dir / f"output.{self.select_format.currentText()}"
-        output_mp4 = output_dir / "output.mp4"
+        output_vid = self._out_dir / f"output.{self.select_format.currentText()}"
+        output_mp4 = self._out_dir / "output.mp4"
         custom_text = self.custom_text_input.text().strip()
         caption = self.caption_text_input.text().strip()
 
-        if not os.path.exists('output/'):
-            os.makedirs('output')
-
         subtitle_style = TextStyle(
             font_size=self.font_size.value()
         )
 
-        clip_settings = ClipSettings(
-            input_path=self.video_file,
-            clip_path=output_clip,
+        clip_kwargs = dict(
+            input_path=Path(self.video_file),
             output_path=output_vid,
             output_format=VideoFormat[self.select_format.currentText().upper()],
             subtitle_style=subtitle_style,
@@ -592,6 +950,8 @@ class Sub2Clip(QMainWindow):
             crop=self.square_checkbox.isChecked(),
             boomerang=self.boomerang_checkbox.isChecked(),
             hd_gif=self.fancy_colors_checkbox.isChecked(),
+            optimize=self.optimize_checkbox.isChecked(),
+            fast_preview=self.fast_preview_checkbox.isChecked(),
             mp4_copy=self.mp4_copy_checkbox.isChecked()
         )
 
@@ -610,24 +970,71 @@ class Sub2Clip(QMainWindow):
             )
 
 
-        err, ok = generate(clip_settings, [sub], cap)
+        output_mp4 = output_mp4 if self.mp4_copy_checkbox.isChecked() else None
+        self._submit_generation(clip_kwargs, [sub], cap, output_vid, output_mp4)
 
-        if ok:
-            size_mb = os.path.getsize(output_vid) / (1024 * 1024)
-            size_mb = f"{size_mb:.2f}"
-            self.status_label.setText(f"{output_vid} generated, size={size_mb}MB")
-            self.preview_vid(output_vid.as_posix())
-            logger.success(f'{output_vid} generated, size={size_mb}MB')
-            if self.mp4_copy_checkbox.isChecked():
-                size_mb_mp4 = os.path.getsize(output_mp4) / (1024 * 1024)
-                size_mb_mp4 = f"{size_mb_mp4:.2f}"
-                logger.success(f'{output_mp4} generated, size={size_mb_mp4}MB')
-        else:
-            self.status_label.setText(f"Something went wrong during generation")
-            logger.error(err)
+    def _submit_generation(self, clip_kwargs, subs, cap, output_vid, output_mp4=None):
+        """Run clip generation on a worker thread; ffmpeg work and the
+        ffprobe calls in ClipSettings would otherwise freeze the window."""
+        self.generate_vid_button.setEnabled(False)
+        self.status_label.setText("Generating...")
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
+
+        self._generate_worker = Worker(self._generate_job, clip_kwargs, subs, cap, report_progress=True)
+        self._generate_worker.signals.progress.connect(self.progress_bar.setValue)
+        self._generate_worker.signals.finished.connect(
+            lambda res: self._on_generate_done(res, output_vid, output_mp4)
+        )
+        QThreadPool.globalInstance().start(self._generate_worker)
+
+    @staticmethod
+    def _generate_job(clip_kwargs, subs, cap, progress=None):
+        from sub2clip.sub2clip import generate
+        from sub2clip.generation import ClipSettings
+
+        try:
+            clip_settings = ClipSettings(**clip_kwargs)
+        except ValueError as e:
+            return Failure(str(e))
+
+        on_progress = None
+        if progress is not None and clip_settings.duration_s > 0:
+            def on_progress(p):
+                pct = p.time.total_seconds() / clip_settings.duration_s * 100
+                progress(min(100, int(pct)))
+
+        return generate(clip_settings, subs, cap, on_progress=on_progress)
+
+    def _on_generate_done(self, res, output_vid, output_mp4=None):
+        self.generate_vid_button.setEnabled(True)
+        self.progress_bar.setVisible(False)
+
+        match res:
+            case Success(_):
+                size_mb = os.path.getsize(output_vid) / (1024 * 1024)
+                size_mb = f"{size_mb:.2f}"
+                self.status_label.setText(f"'{output_vid}' generated, size={size_mb}MB")
+                self.preview_vid(output_vid.as_posix())
+                logger.success(f'{output_vid} generated, size={size_mb}MB')
+                if output_mp4 is not None:
+                    size_mb_mp4 = os.path.getsize(output_mp4) / (1024 * 1024)
+                    size_mb_mp4 = f"{size_mb_mp4:.2f}"
+                    logger.success(f'{output_mp4} generated, size={size_mb_mp4}MB')
+            case Failure(err):
+                self.status_label.setText("Something went wrong during generation")
+                logger.error(err)
 
     def preview_vid(self, vid_path):
-        self.vid_movie = QMovie(vid_path)
+        # Loop playback from RAM; QMovie on a file path re-reads from disk
+        # every cycle. References live on self so Qt doesn't lose the device.
+        self._vid_data = QByteArray(Path(vid_path).read_bytes())
+        self._vid_buffer = QBuffer(self._vid_data)
+        self._vid_buffer.open(QBuffer.ReadOnly)
+
+        self.vid_movie = QMovie()
+        self.vid_movie.setDevice(self._vid_buffer)
+        self.vid_movie.setFormat(Path(vid_path).suffix[1:].encode())
         self.vid_preview.setMovie(self.vid_movie)
         self.vid_movie.start()
 
@@ -635,18 +1042,14 @@ class Sub2Clip(QMainWindow):
         logger.success("closing...")
 
     def _slider_to_time(self, slider_value):
-        step = 1000 / (self.original_end - self.original_start + 2 * self.PADDING)
-        slider_zero = self.original_start - self.PADDING
-        return (slider_value / step) + slider_zero
+        return (slider_value / self._slider_step) + self._slider_zero
 
     def _time_to_slider(self, time):
-        step = 1000 / (self.original_end - self.original_start + 2 * self.PADDING)
-        slider_zero = self.original_start - self.PADDING
-        return (time - slider_zero) * step
+        return (time - self._slider_zero) * self._slider_step
 
     def on_slider_range_change(self, start, end):
         """Update time labels and spinboxes when slider range changes"""
-        if not hasattr(self, 'original_start') or not hasattr(self, 'original_end'):
+        if not self._has_original:
             self.status_label.setText("Please select a subtitle first")
             return
 
@@ -658,14 +1061,17 @@ class Sub2Clip(QMainWindow):
         start_time = max(0, start_time)
         end_time = max(0, end_time)
 
-        self.start_time.setValue(start_time)
+        # Block the spinboxes so their valueChanged doesn't echo straight
+        # back into the slider we are reacting to
+        with QSignalBlocker(self.start_time), QSignalBlocker(self.end_time):
+            self.start_time.setValue(start_time)
+            self.end_time.setValue(end_time)
         self.start_time_label.setText(f"Start: {start_time:.2f}s")
-        self.end_time.setValue(end_time)
         self.end_time_label.setText(f"End: {end_time:.2f}s")
 
     def on_start_time_change(self, value):
         """Update slider and labels when start time changes"""
-        if not hasattr(self, 'original_start') or not hasattr(self, 'original_end'):
+        if not self._has_original:
             self.status_label.setText("Please select a subtitle first")
             return
 
@@ -676,12 +1082,13 @@ class Sub2Clip(QMainWindow):
         slider_value = max(0, min(1000, slider_value))
 
         current_end = self.time_slider._end
-        self.time_slider.setValues(slider_value, current_end)
+        with QSignalBlocker(self.time_slider):
+            self.time_slider.setValues(slider_value, current_end)
         self.start_time_label.setText(f"Start: {value:.2f}s")
 
     def on_end_time_change(self, value):
         """Update slider and labels when end time changes"""
-        if not hasattr(self, 'original_start') or not hasattr(self, 'original_end'):
+        if not self._has_original:
             self.status_label.setText("Please select a subtitle first")
             return
 
@@ -692,7 +1099,8 @@ class Sub2Clip(QMainWindow):
         slider_value = max(0, min(1000, slider_value))
 
         current_start = self.time_slider._start
-        self.time_slider.setValues(current_start, slider_value)
+        with QSignalBlocker(self.time_slider):
+            self.time_slider.setValues(current_start, slider_value)
         self.end_time_label.setText(f"End: {value:.2f}s")
 
 def main():
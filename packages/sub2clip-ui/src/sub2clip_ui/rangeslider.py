@@ -1,6 +1,6 @@
 from PyQt5.QtWidgets import QWidget
-from PyQt5.QtCore import Qt, QRect, pyqtSignal
-from PyQt5.QtGui import QPainter, QColor
+from PyQt5.QtCore import Qt, QRect, QTimer, pyqtSignal
+from PyQt5.QtGui import QPainter, QColor, QPixmap
 
 class RangeSlider(QWidget):
     """A custom range slider widget that allows selecting both start and end values"""
@@ -19,7 +19,15 @@ class RangeSlider(QWidget):
         self._dragging_end = False
         self._original_start = None
         self._original_end = None
-        
+
+        # Mouse moves arrive far faster than the display refreshes; repaints
+        # and rangeChanged emits during a drag are throttled to ~60 Hz
+        self._pending_emit = False
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(16)
+        self._update_timer.timeout.connect(self._on_throttle_timeout)
+
         # Modern color scheme
         self._bar_color = QColor(220, 220, 220)  # Light gray for background
         self._original_range_color = QColor(200, 200, 200)  # Slightly darker for original range
@@ -28,6 +36,50 @@ class RangeSlider(QWidget):
         self._handle_border_color = QColor(255, 255, 255)  # White border for handles
         self._indicator_color = QColor(100, 100, 100)      # Dark gray for indicators
 
+        # Rendered on first paint (when the device pixel ratio is known)
+        self._handle_pixmap = None
+
+        self._update_scale()
+
+    def _handle_pix(self):
+        """Shadow, border and fill of a handle rendered once into a pixmap;
+        paintEvent blits it instead of rasterizing antialiased ellipses."""
+        if self._handle_pixmap is None:
+            size = self._handle_size + 4
+            dpr = self.devicePixelRatioF()
+            pm = QPixmap(int(size * dpr), int(size * dpr))
+            pm.setDevicePixelRatio(dpr)
+            pm.fill(Qt.transparent)
+            p = QPainter(pm)
+            p.setRenderHint(QPainter.Antialiasing)
+            rect = QRect(1, 1, self._handle_size, self._handle_size)
+            p.setPen(Qt.NoPen)
+            p.setBrush(QColor(0, 0, 0, 30))
+            p.drawEllipse(rect.translated(1, 1))
+            p.setPen(self._handle_border_color)
+            p.setBrush(self._handle_color)
+            p.drawEllipse(rect)
+            p.end()
+            self._handle_pixmap = pm
+        return self._handle_pixmap
+
+    def _update_scale(self):
+        """Cache the value->pixel mapping; paint and hit-testing read the
+        cached positions instead of redoing the division per event."""
+        span = self._max - self._min
+        self._scale = self.width() / span if span else 0.0
+        self._start_px = int((self._start - self._min) * self._scale)
+        self._end_px = int((self._end - self._min) * self._scale)
+        self._painted_start_px = self._start_px
+        self._painted_end_px = self._end_px
+        if self._original_start is not None and self._original_end is not None:
+            self._orig_start_px = int((self._original_start - self._min) * self._scale)
+            self._orig_end_px = int((self._original_end - self._min) * self._scale)
+
+    def resizeEvent(self, event):
+        self._update_scale()
+        super().resizeEvent(event)
+
     def resetToOriginal(self):
         """Reset the slider to the original timestamps"""
         if self._original_start is not None and self._original_end is not None:
@@ -38,96 +90,131 @@ class RangeSlider(QWidget):
         self._max = max_val
         self._start = min_val
         self._end = max_val
+        self._update_scale()
         self.update()
-        
+
     def setValues(self, start, end):
         self._start = max(self._min, min(self._max, start))
         self._end = max(self._min, min(self._max, end))
+        self._start_px = int((self._start - self._min) * self._scale)
+        self._end_px = int((self._end - self._min) * self._scale)
         self.update()
         self.rangeChanged.emit(self._start, self._end)
-        
+
     def setOriginalTimes(self, start, end):
         """Set the original subtitle timing for visual reference"""
         self._original_start = start
         self._original_end = end
+        self._orig_start_px = int((start - self._min) * self._scale)
+        self._orig_end_px = int((end - self._min) * self._scale)
         self.update()
         
     def getValues(self):
         return self._start, self._end
         
     def paintEvent(self, event):
+        # No antialiasing: the bars and indicator lines are axis-aligned and
+        # the handles blit from a pixmap that was rendered antialiased once
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
+
+        # Partial repaints (drag flushes pass just the moved handle's band):
+        # skip draw blocks that fall entirely outside the dirty rect
+        dirty = event.rect()
+
         # Draw the background bar with rounded corners
         bar_rect = QRect(0, self.height()//2 - self._bar_height//2,
                         self.width(), self._bar_height)
         painter.setPen(Qt.NoPen)
         painter.setBrush(self._bar_color)
         painter.drawRoundedRect(bar_rect, self._bar_height//2, self._bar_height//2)
-        
+
         # Draw the original timing indicators if set
         if self._original_start is not None and self._original_end is not None:
-            # Draw original range in a different color
-            start_pos = int((self._original_start - self._min) / (self._max - self._min) * self.width())
-            end_pos = int((self._original_end - self._min) / (self._max - self._min) * self.width())
-            original_rect = QRect(start_pos, self.height()//2 - self._bar_height//2,
-                                end_pos - start_pos, self._bar_height)
-            painter.setBrush(self._original_range_color)
-            painter.drawRoundedRect(original_rect, self._bar_height//2, self._bar_height//2)
-            
-            # Draw vertical lines for original start and end
-            painter.setPen(self._indicator_color)
-            painter.drawLine(start_pos, self.height()//2 - 10, start_pos, self.height()//2 + 10)
-            painter.drawLine(end_pos, self.height()//2 - 10, end_pos, self.height()//2 + 10)
-        
+            start_pos = self._orig_start_px
+            end_pos = self._orig_end_px
+            indicator_band = QRect(start_pos - 1, 0, end_pos - start_pos + 3, self.height())
+            if dirty.intersects(indicator_band):
+                # Draw original range in a different color
+                original_rect = QRect(start_pos, self.height()//2 - self._bar_height//2,
+                                    end_pos - start_pos, self._bar_height)
+                painter.setBrush(self._original_range_color)
+                painter.drawRoundedRect(original_rect, self._bar_height//2, self._bar_height//2)
+
+                # Draw vertical lines for original start and end
+                painter.setPen(self._indicator_color)
+                painter.drawLine(start_pos, self.height()//2 - 10, start_pos, self.height()//2 + 10)
+                painter.drawLine(end_pos, self.height()//2 - 10, end_pos, self.height()//2 + 10)
+                painter.setPen(Qt.NoPen)
+
         # Draw the selected range
-        start_pos = int((self._start - self._min) / (self._max - self._min) * self.width())
-        end_pos = int((self._end - self._min) / (self._max - self._min) * self.width())
+        start_pos = self._start_px
+        end_pos = self._end_px
         selected_rect = QRect(start_pos, self.height()//2 - self._bar_height//2,
                             end_pos - start_pos, self._bar_height)
-        painter.setBrush(self._selected_range_color)
-        painter.drawRoundedRect(selected_rect, self._bar_height//2, self._bar_height//2)
-        
-        # Draw the handles with border and shadow effect
+        if dirty.intersects(selected_rect):
+            painter.setBrush(self._selected_range_color)
+            painter.drawRoundedRect(selected_rect, self._bar_height//2, self._bar_height//2)
+
+        # Blit the pre-rendered handles (shadow, border and fill included)
+        handle_pix = self._handle_pix()
         for pos in [start_pos, end_pos]:
             handle_rect = QRect(pos - self._handle_size//2,
                               self.height()//2 - self._handle_size//2,
                               self._handle_size, self._handle_size)
-            
-            # Draw handle shadow
-            shadow_rect = handle_rect.translated(1, 1)
-            painter.setBrush(QColor(0, 0, 0, 30))
-            painter.drawEllipse(shadow_rect)
-            
-            # Draw handle border
-            painter.setPen(self._handle_border_color)
-            painter.setBrush(self._handle_color)
-            painter.drawEllipse(handle_rect)
+            if not dirty.intersects(handle_rect.adjusted(-1, -1, 2, 2)):
+                continue
+            painter.drawPixmap(handle_rect.x() - 1, handle_rect.y() - 1, handle_pix)
+
+        self._painted_start_px = start_pos
+        self._painted_end_px = end_pos
             
     def mousePressEvent(self, event):
-        start_pos = int((self._start - self._min) / (self._max - self._min) * self.width())
-        end_pos = int((self._end - self._min) / (self._max - self._min) * self.width())
-        
-        if abs(event.x() - start_pos) < self._handle_size:
+        if abs(event.x() - self._start_px) < self._handle_size:
             self._dragging_start = True
-        elif abs(event.x() - end_pos) < self._handle_size:
+        elif abs(event.x() - self._end_px) < self._handle_size:
             self._dragging_end = True
             
     def mouseMoveEvent(self, event):
         if self._dragging_start:
             new_start = self._min + (event.x() / self.width()) * (self._max - self._min)
-            new_start = max(self._min, min(new_start, self._end))
-            self._start = new_start
-            self.update()
-            self.rangeChanged.emit(self._start, self._end)
+            self._start = max(self._min, min(new_start, self._end))
+            self._start_px = int((self._start - self._min) * self._scale)
         elif self._dragging_end:
             new_end = self._min + (event.x() / self.width()) * (self._max - self._min)
-            new_end = max(self._start, min(new_end, self._max))
-            self._end = new_end
-            self.update()
-            self.rangeChanged.emit(self._start, self._end)
-            
+            self._end = max(self._start, min(new_end, self._max))
+            self._end_px = int((self._end - self._min) * self._scale)
+        else:
+            return
+
+        # Leading-edge flush, then coalesce everything inside the interval
+        if self._update_timer.isActive():
+            self._pending_emit = True
+        else:
+            self._flush()
+            self._update_timer.start()
+
+    def _on_throttle_timeout(self):
+        if self._pending_emit:
+            self._flush()
+
+    def _flush(self):
+        self._pending_emit = False
+        # Only the band a handle moved through needs repainting; the rest of
+        # the widget (bar, original-range markers) is unchanged during a drag
+        dirty = QRect()
+        for old, new in ((self._painted_start_px, self._start_px),
+                         (self._painted_end_px, self._end_px)):
+            if old != new:
+                lo = min(old, new) - self._handle_size
+                dirty = dirty.united(QRect(lo, 0, max(old, new) - lo + self._handle_size + 2, self.height()))
+        if not dirty.isNull():
+            self.update(dirty)
+        self.rangeChanged.emit(self._start, self._end)
+
     def mouseReleaseEvent(self, event):
+        # Don't drop the final position of the drag
+        if self._pending_emit:
+            self._update_timer.stop()
+            self._flush()
         self._dragging_start = False
-        self._dragging_end = False 
\ No newline at end of file
+        self._dragging_end = False
@@ -1,9 +1,16 @@
 import json
+import os
+import shutil
+import subprocess
+import threading
 import time
 import functools
 import logging
 import pysubs2
-from ffmpeg import FFmpeg, FFmpegError
+from dataclasses import asdict
+from ffmpeg import FFmpeg, FFmpegError, Progress
+from ffmpeg.statistics import Statistics
+from ffmpeg.utils import readlines
 from sub2clip.generation import ClipSettings
 from pathlib import Path
 from returns.result import Result, Success, Failure
@@ -11,31 +18,65 @@ from returns.result import Result, Success, Failure
 # module logger
 logger = logging.getLogger(__name__)
 
+# Filter graphs (palette, subtitles, scale) are single-threaded by default;
+# capped because filter threading stops scaling well beyond this
+_FILTER_THREADS = min(os.cpu_count() or 1, 16)
+
+# gifski builds per-frame palettes with better dithering than palettegen and
+# encodes multithreaded; preferred for GIF output when it is installed
+GIFSKI = shutil.which('gifski')
+
 
 def timeit(func):
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
+        # Level checked per call (it can change at runtime); when DEBUG is
+        # off the decorator costs one isEnabledFor lookup and nothing else
+        if not logger.isEnabledFor(logging.DEBUG):
+            return func(*args, **kwargs)
+
         start = time.perf_counter()
         try:
             result = func(*args, **kwargs)
         except Exception:
             elapsed = time.perf_counter() - start
-            msg = f"{func.__name__} raised after {elapsed:.3f}s"
-            logger.debug(msg)
-            if logger.isEnabledFor(logging.DEBUG):
-                print(msg)
+            logger.debug(f"{func.__name__} raised after {elapsed:.3f}s")
             raise
         else:
             elapsed = time.perf_counter() - start
-            msg = f"{func.__name__} took {elapsed:.3f}s"
-            logger.debug(msg)
-            if logger.isEnabledFor(logging.DEBUG):
-                print(msg)
+            logger.debug(f"{func.__name__} took {elapsed:.3f}s")
             return result
 
     return wrapper
 
 
+# Parsed ffprobe output per file; a typical workflow probes the same video
+# three or four times (dimensions, subtitle tracks, stream checks) and each
+# probe is a full subprocess launch
+_probe_cache: dict[tuple[str, int, int], dict] = {}
+
+
+def _probe(path) -> dict:
+    """Parsed ffprobe stream metadata for the given file, cached on
+    (path, mtime, size) so repeated probes of an unchanged file are free."""
+    st = os.stat(path)
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    media = _probe_cache.get(key)
+    if media is None:
+        # Literal argv: the probe runs dozens of times in a batch and the
+        # chained-option wrapper allocates a dict/list per call for nothing.
+        # Only the fields the helpers read are requested — full -show_streams
+        # output runs to tens of KB of JSON on multi-track mkvs
+        out = subprocess.run(
+            ['ffprobe', '-v', 'error', '-print_format', 'json',
+             '-show_entries', 'stream=index,codec_type,codec_name,width,height:stream_tags=language,title',
+             str(path)],
+            capture_output=True, check=True
+        ).stdout
+        media = _probe_cache[key] = json.loads(out)
+    return media
+
+
 def _return_ffmpeg_command(ffmpeg):
     """Prints the complete FFmpeg command with quotation marks around the filters tag, making copy-pasting into a shell very easy
 
@@ -67,27 +108,41 @@ def generate_caption_png(size: str, vf, png_out: Path) -> tuple[None|str, bool]:
 @timeit
 def get_dimensions(path: Path) -> tuple[tuple[int,int]|str, bool]:
     try:
-        ffmpeg = (
-            FFmpeg(executable="ffprobe")
-            .input(path)
-            .option('select_streams', value='v:0')
-            .option('show_entries', value='stream=width,height')
-            .option('of', value="csv=p=0")
-        )
-        res = ffmpeg.execute().decode().strip()
-        w, h = map(int, res.split(','))
-
-        return (w, h), True
-    except FFmpegError as e:
-        return f'FFmpeg error during ffprobe: {e}. Command = {_return_ffmpeg_command(e)}', False
+        for stream in _probe(path).get("streams", []):
+            if stream.get("codec_type") == "video":
+                return (int(stream["width"]), int(stream["height"])), True
+        return f'No video stream found for {path}', False
+    except (subprocess.CalledProcessError, OSError) as e:
+        return f'ffprobe failed for {path}: {e}', False
 
 
 
 @timeit
-def run_ffmpeg(input: Path, output: Path, filters=None, thumbnail: bool = False) -> Result[None, str]:
-    ffmpeg = FFmpeg().option('y').input(input)
+def run_ffmpeg(input: Path, output: Path, filters=None, thumbnail: bool = False,
+               start_s: float | None = None, duration_s: float | None = None,
+               on_progress=None) -> Result[None, str]:
+    ffmpeg = FFmpeg().option('y')
+
+    # python-ffmpeg parses ffmpeg's -progress stream and emits it as events
+    if on_progress is not None:
+        ffmpeg.on('progress', on_progress)
+
+    # -ss/-t as input options: fast keyframe seek, and the decoder only
+    # touches the requested segment instead of a pre-cut intermediate file
+    if start_s is not None:
+        ffmpeg = ffmpeg.option('ss', value=start_s)
+    if duration_s is not None and not thumbnail:
+        ffmpeg = ffmpeg.option('t', value=duration_s)
 
-    opts = { 'loop': 0 }
+    ffmpeg = (
+        ffmpeg
+        .option('filter_threads', value=_FILTER_THREADS)
+        .option('filter_complex_threads', value=_FILTER_THREADS)
+        .input(input)
+    )
+
+    # threads 0 = let libavcodec pick frame/slice parallelism
+    opts = { 'loop': 0, 'threads': 0 }
     if filters:
         opts['filter_complex'] = filters
 
@@ -104,9 +159,69 @@ def run_ffmpeg(input: Path, output: Path, filters=None, thumbnail: bool = False)
 
 
 @timeit
-def extract_subtitles(input: Path, output: Path, track: int) -> Result[pysubs2.SSAFile, str]:
-    ffprobe = FFmpeg(executable="ffprobe").input(input, print_format="json", show_streams=None)
-    media = json.loads(ffprobe.execute())
+def run_ffmpeg_gifski(input: Path, output: Path, filters: str, fps: int,
+                      start_s: float | None = None, duration_s: float | None = None,
+                      on_progress=None) -> Result[None, str]:
+    """Decode with ffmpeg and pipe raw frames into gifski for GIF encoding.
+
+    Only called when GIFSKI is set; the caller must build `filters` without
+    the palettegen/paletteuse chain since gifski handles quantization itself.
+    on_progress receives the same python-ffmpeg Progress objects run_ffmpeg
+    emits, parsed from the decoder's stats lines.
+    """
+    ffmpeg = FFmpeg().option('y')
+    if start_s is not None:
+        ffmpeg = ffmpeg.option('ss', value=start_s)
+    if duration_s is not None:
+        ffmpeg = ffmpeg.option('t', value=duration_s)
+    ffmpeg = (
+        ffmpeg
+        .option('filter_threads', value=_FILTER_THREADS)
+        .option('filter_complex_threads', value=_FILTER_THREADS)
+        .input(input)
+    )
+
+    opts = { 'f': 'yuv4mpegpipe', 'threads': 0 }
+    if filters:
+        opts['filter_complex'] = filters
+    ffmpeg = ffmpeg.output('pipe:1', opts)
+
+    stderr = subprocess.DEVNULL if on_progress is None else subprocess.PIPE
+    decode = subprocess.Popen(ffmpeg.arguments, stdout=subprocess.PIPE, stderr=stderr)
+
+    tracker = None
+    if on_progress is not None:
+        # Parse the decoder's stats lines into Progress objects while gifski
+        # consumes the frames; mirrors python-ffmpeg's own tracker
+        def _track():
+            for raw in readlines(decode.stderr):
+                statistics = Statistics.from_line(raw.decode(errors='replace'))
+                if statistics is not None:
+                    on_progress(Progress(**asdict(statistics)))
+        tracker = threading.Thread(target=_track, daemon=True)
+        tracker.start()
+
+    encode = subprocess.run(
+        [GIFSKI, '--fps', str(fps), '--quality', '90', '-o', str(output), '-'],
+        stdin=decode.stdout,
+        capture_output=True
+    )
+    decode.stdout.close()
+    decode.wait()
+    if tracker is not None:
+        tracker.join()
+
+    if decode.returncode != 0 or encode.returncode != 0:
+        return Failure(
+            f'gifski pipeline failed (ffmpeg rc={decode.returncode}, gifski rc={encode.returncode}): '
+            f'{encode.stderr.decode(errors="replace").strip()}'
+        )
+    return Success(None)
+
+
+@timeit
+def extract_subtitles(input: Path, track: int) -> Result[pysubs2.SSAFile, str]:
+    media = _probe(input)
     sub_streams = [
         stream for stream in media.get("streams", [])
         if stream["codec_type"] == 'subtitle'
@@ -115,13 +230,15 @@ def extract_subtitles(input: Path, output: Path, track: int) -> Result[pysubs2.S
     if len(sub_streams) == 0:
         return Failure("No subtitle streams found for " + input.as_posix())
 
+    # Stream the srt over stdout: no temp file write/read per video
     try:
-        (
+        srt = (
             FFmpeg()
             .option("y")
             .input(input)
             .output(
-                output,
+                'pipe:1',
+                {'f': 'srt'},
                 map=[f'0:s:{track}'],
                 an=None,
                 vn=None)
@@ -129,17 +246,14 @@ def extract_subtitles(input: Path, output: Path, track: int) -> Result[pysubs2.S
     except FFmpegError as e:
         return Failure(f'Could not extract subtitles from video {input} at sub track {track}: {e}')
 
-    if Path(output).exists():
-        subs = pysubs2.load(output.__str__())
-
-        return Success(subs)
-    else:
+    if not srt:
         return Failure(f'Could not extract subtitles from video {input} at sub track {track}')
 
+    return Success(pysubs2.SSAFile.from_string(srt.decode('utf-8', errors='replace')))
+
 @timeit
 def get_subtitle_lang_track(input: Path, langs: list[str], include_cc: bool = False) -> Result[int, str]:
-    ffprobe = FFmpeg(executable="ffprobe").input(input, print_format="json", show_streams=None)
-    media = json.loads(ffprobe.execute())
+    media = _probe(input)
 
     sub_streams = [
         stream for stream in media.get("streams", [])
@@ -177,24 +291,51 @@ def get_subtitle_lang_track(input: Path, langs: list[str], include_cc: bool = Fa
     return Success(int(target_stream.get('index'))-len(non_sub_streams))
 
 def _has_video_stream(path):
-    ffprobe = FFmpeg(executable="ffprobe").input(path, print_format="json", show_streams=None)
-    media = json.loads(ffprobe.execute())
+    # -select_streams v makes ffprobe do the filtering: it prints one index
+    # per video stream and nothing otherwise, so no JSON parse is needed.
+    # This runs against freshly written clips, which the probe cache would
+    # never hit anyway
+    out = subprocess.run(
+        ['ffprobe', '-v', 'error', '-select_streams', 'v',
+         '-show_entries', 'stream=index', '-of', 'csv=p=0', str(path)],
+        capture_output=True
+    ).stdout
+    return bool(out.strip())
 
-    return any(
-        stream.get("codec_type") == "video"
-        for stream in media.get("streams", [])
-    )
-    
 
 @timeit
 def create_clip(clip_settings: ClipSettings) -> Result[None, str]:
+    # The speculative copy pass is doomed when the input has no video
+    # stream, or when its codec can't be remuxed into the target container
+    # after a keyframe seek; go straight to the re-encode in those cases
+    try:
+        video_codec = next(
+            (stream.get('codec_name') for stream in _probe(clip_settings.input_path).get('streams', [])
+             if stream.get('codec_type') == 'video'),
+            None
+        )
+        if video_codec is None or (
+            Path(clip_settings.clip_path).suffix.lower() == '.mp4'
+            and video_codec in {'hevc', 'vp9', 'av1'}
+        ):
+            (
+                FFmpeg().option('y')
+                        .input(clip_settings.input_path)
+                        .option('ss', value=clip_settings.start_s)
+                        .option('t', value=clip_settings.duration_s)
+                        .output(clip_settings.clip_path, { 'c:v': 'libx265', 'crf': clip_settings.crf, 'preset': clip_settings.preset })
+            ).execute()
+            return Success(None)
+    except (FFmpegError, subprocess.CalledProcessError, OSError) as e:
+        return Failure(f'FFmpegError during clip creation: {e}')
 
     ffmpeg = (
         FFmpeg().option('y')
                 .input(clip_settings.input_path)
                 .option('ss', value=clip_settings.start_s)
                 .option('t', value=clip_settings.duration_s)
-                .output(clip_settings.clip_path, { 'c': 'copy' })
+                # keeps timestamps sane when the keyframe seek lands mid-GOP
+                .output(clip_settings.clip_path, { 'c': 'copy', 'avoid_negative_ts': 'make_zero' })
     )
 
     try:
@@ -1,3 +1,4 @@
+from __future__ import annotations
 from dataclasses import (dataclass, field)
 from pathlib import Path
 from enum import Enum
@@ -171,6 +172,8 @@ class ClipSettings:
         crop (bool, optional): Crop the clip to a square (e.g. 200x200). Default False.
         boomerang (bool, optional): Append the reverse of the clip. Default False.
         hd_gif (bool, optional): Use high quality colors for the GIF, increasing file size significantly. Default False.
+        optimize (bool, optional): Drop duplicate frames (mpdecimate) and use ordered dithering to shrink GIF size and encode time. Default False.
+        fast_preview (bool, optional): Skip the palettegen/paletteuse pass entirely for GIFs, trading quality for a single-pass encode. Default False.
         mp4_copy (bool, optional): Generate a copy mp4 (with burnt-in caption/subtiles). Default False.
         crf (int, optional): Constant Rate Factor, value used by FFmpeg for re-encoding. Default 18.
         preset (str, optional): Re-encoding preset used by FFmpeg. Default 'fast'.
@@ -198,6 +201,8 @@ class ClipSettings:
     crop: bool = False
     boomerang: bool = False
     hd_gif: bool = False
+    optimize: bool = False
+    fast_preview: bool = False
     mp4_copy: bool = False
     # Compression settings for FFmpeg
     crf: int = 18
@@ -339,7 +344,7 @@ class ClipSettings:
         ])
 
 
-    def build_clip_filters(self, tmp_dir: str, subtitles: list[Subtitle] | None = None, caption: Subtitle | None = None) -> list[str]:
+    def build_clip_filters(self, tmp_dir: str, subtitles: list[Subtitle] | None = None, caption: Subtitle | None = None, palette: bool = True) -> list[str]:
         vf_filters = []
 
         if self.boomerang:
@@ -386,6 +391,11 @@ class ClipSettings:
 
         if subtitles is not None:
 
+            if self.optimize:
+                # Drop duplicate frames before resampling; fewer frames go
+                # through palette lookup and LZW encoding
+                vf_filters.append('mpdecimate')
+
             vf_filters.append(f'fps={self.fps}')
 
             ass = self._generate_ass(subtitles, caption, padding)
@@ -394,9 +404,13 @@ class ClipSettings:
 
             vf_filters.append(f"subtitles={ass_file.resolve()}")
 
-        if self.output_format == VideoFormat.GIF:
-            # Palette
-            if self.hd_gif:
+        if self.output_format == VideoFormat.GIF and palette and not self.fast_preview:
+            # Palette. fast_preview skips this entirely: palettegen needs a
+            # full decode pass over every frame before a single GIF byte is
+            # written, which doubles the work for draft-quality output
+            if self.optimize:
+                vf_filters.append("split[s0][s1];[s0]palettegen=max_colors=64[p];[s1][p]paletteuse=dither=bayer:bayer_scale=5")
+            elif self.hd_gif:
                 vf_filters.append("split[s0][s1];[s0]palettegen[p];[s1][p]paletteuse")
             else:
                 vf_filters.append("split[s0][s1];[s0]palettegen=max_colors=32[p];[s1][p]paletteuse=dither=bayer")
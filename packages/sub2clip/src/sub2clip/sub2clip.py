@@ -1,7 +1,9 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from .ffmpeg_helpers import (run_ffmpeg, extract_subtitles, get_subtitle_lang_track, create_clip, create_thumbnail)
+from .ffmpeg_helpers import (GIFSKI, run_ffmpeg, run_ffmpeg_gifski, extract_subtitles, get_subtitle_lang_track)
 from sub2clip.subtitles import Subtitle
-from sub2clip.generation import (ClipSettings)
+from sub2clip.generation import (ClipSettings, VideoFormat)
 from tempfile import TemporaryDirectory
 from returns.result import Result, Success, Failure
 import pysubs2
@@ -18,25 +20,22 @@ def extract_subs(video_path: Path, subtitle_track: int = 0) -> Result[list[Subti
             - Success(list[Subtitle]) when subtitle extraction succeeded.
             - Failure(str) when subtitle extraction failed, str being the error message
     """
-    with TemporaryDirectory() as tmp:
-        output_path = Path(tmp) / 'subs.srt'
-
-        res = extract_subtitles(video_path, output_path, subtitle_track)
+    res = extract_subtitles(video_path, subtitle_track)
 
-        def to_subs(file: pysubs2.SSAFile) -> list[Subtitle]:
-            subs = [Subtitle(
-                start=ssa.start,
-                end=ssa.end,
-                text=ssa.text.replace("\\N", "\n")
-            ) for ssa in file]
+    def to_subs(file: pysubs2.SSAFile) -> list[Subtitle]:
+        subs = [Subtitle(
+            start=ssa.start,
+            end=ssa.end,
+            text=ssa.text.replace("\\N", "\n")
+        ) for ssa in file]
 
-            for i, sub in enumerate(subs):
-                sub.prv = subs[i-1] if i > 0 else None
-                sub.nxt = subs[i+1] if i < len(subs)-1 else None
+        for prv, nxt in zip(subs, subs[1:]):
+            prv.nxt = nxt
+            nxt.prv = prv
 
-            return subs
+        return subs
 
-        return res.map(to_subs)
+    return res.map(to_subs)
 
 def extract_subs_by_language(video_path: Path, languages: list[str], include_cc: bool = False) -> Result[list[Subtitle], str]:
     """Extracts subtitles from the given Path based on the given languages.
@@ -59,35 +58,70 @@ def extract_subs_by_language(video_path: Path, languages: list[str], include_cc:
         for extracted_subs in extract_subs(video_path, idx)
     )
 
-def generate(clip_settings: ClipSettings, subtitles: list[Subtitle] | None, caption: Subtitle | None = None, thumbnail: bool = False) -> Result[None, str]:
+def extract_subs_by_language_batch(video_paths: list[Path], languages: list[str], include_cc: bool = False) -> list[Result[list[Subtitle], str]]:
+    """Extracts subtitles from several videos concurrently.
+    Each video goes through extract_subs_by_language; the ffprobe and ffmpeg
+    calls block on subprocesses, so threads overlap the per-video latency.
+
+    Args:
+        video_paths (list[Path]): Input videos
+        languages (list[str]): List of languages, priotizes left to right. Must be ISO 639 language code.
+        include_cc (bool, optional): Whether to include subtitles marked as Closed Captions, Hearing Impaired or similar. Defaults to False.
+
+    Returns:
+        list[Result[Success(list[Subtitle])|Failure(str)]]: One Result per video, in the same order as video_paths.
+    """
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as ex:
+        return list(ex.map(lambda path: extract_subs_by_language(path, languages, include_cc), video_paths))
+
+def generate(clip_settings: ClipSettings, subtitles: list[Subtitle] | None, caption: Subtitle | None = None, thumbnail: bool = False, on_progress=None) -> Result[None, str]:
     """Generate a clip with the given clipsettings and subtitles. Caption is optional.
 
     Args:
         clip_settings (ClipSettings): ClipSettings to use. See ClipSettings for explanation
         subtitles (list[Subtitle]): List of subtitles to render in the clip.
         caption (Subtitle, optional): Caption to display above the clip, lasts for the entire clip. Defaults to None.
+        on_progress (callable, optional): Called with python-ffmpeg Progress updates during encoding. Defaults to None.
 
     Returns:
         Result[Success(None)|Failure(str)]:
             - Sucess(None) when generation succeeeded.
             - Failure(str), str is the error message.
     """
-    if thumbnail:
-        err = create_thumbnail(clip_settings)
-        match err:
-            case Failure(err):
-                return Failure(err)
-    else:
-        err = create_clip(clip_settings)
-        match err:
-            case Failure(err):
-                return Failure(err)
-
     with TemporaryDirectory() as tmp:
-        vf_filters = clip_settings.build_clip_filters(tmp, subtitles, caption)
+        # gifski does its own quantization, so the palette filter chain is
+        # only built when encoding through ffmpeg's gif muxer
+        use_gifski = (
+            GIFSKI is not None
+            and clip_settings.output_format == VideoFormat.GIF
+            and not clip_settings.fast_preview
+            and not thumbnail
+        )
+        vf_filters = clip_settings.build_clip_filters(tmp, subtitles, caption, palette=not use_gifski)
         vf = ",".join(vf_filters)
 
-        err = run_ffmpeg(clip_settings.clip_path, clip_settings.output_path, vf, thumbnail)
+        if use_gifski:
+            err = run_ffmpeg_gifski(
+                clip_settings.input_path,
+                clip_settings.output_path,
+                vf,
+                clip_settings.fps,
+                start_s=clip_settings.start_s,
+                duration_s=clip_settings.duration_s,
+                on_progress=on_progress
+            )
+        else:
+            # Single ffmpeg invocation with input seeking: no intermediate
+            # clip.mp4 encode/decode round trip
+            err = run_ffmpeg(
+                clip_settings.input_path,
+                clip_settings.output_path,
+                vf,
+                thumbnail,
+                start_s=clip_settings.start_s,
+                duration_s=clip_settings.duration_s,
+                on_progress=on_progress
+            )
         match err:
             case Failure(err):
                 return Failure(err)
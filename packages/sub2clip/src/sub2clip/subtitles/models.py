@@ -1,7 +1,7 @@
 from __future__ import annotations
 from dataclasses import (dataclass, field)
 
-@dataclass(order=True)
+@dataclass(order=True, slots=True)
 class Subtitle:
     """Class to represent a Subtitle. Immutable, and are comparable (by timestamp)
 